@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Client-side captcha verification for the BLS-SPANISH backend tests.
+Scores raw uint8 RGB captcha tiles against a digit template so the solver's
+selected_indices can be cross-checked locally.
+"""
+
+import base64
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    # numba is optional; without it the same loops run as plain Python
+    def njit(*args, **kwargs):
+        def wrap(fn):
+            return fn
+        return wrap
+
+@njit(cache=True, fastmath=True)
+def match_digit(template, tiles):
+    """Sum of squared differences between the uint8 template and each uint8 tile"""
+    n, h, w, c = tiles.shape
+    scores = np.empty(n, dtype=np.int64)
+    for i in range(n):
+        acc = np.int64(0)
+        for y in range(h):
+            for x in range(w):
+                for k in range(c):
+                    # Widen before subtracting so uint8 differences cannot wrap
+                    d = np.int32(tiles[i, y, x, k]) - np.int32(template[y, x, k])
+                    acc += d * d
+        scores[i] = acc
+    return scores
+
+def load_template(path, height, width):
+    """Read a raw RGB digit template from disk"""
+    with open(path, 'rb') as f:
+        return np.frombuffer(f.read(), dtype=np.uint8).reshape(height, width, 3)
+
+def decode_tiles(images, height, width):
+    """Decode base64 raw RGB tiles into one (N, H, W, 3) array"""
+    return np.stack([
+        np.frombuffer(base64.b64decode(image), dtype=np.uint8).reshape(height, width, 3)
+        for image in images
+    ])
+
+def select_tiles(template, tiles, threshold):
+    """Indices of tiles whose mean squared difference from the template is within threshold"""
+    scores = match_digit(template, tiles) / template.size
+    return [int(i) for i in np.nonzero(scores <= threshold)[0]]
@@ -0,0 +1,32 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from captcha_client import match_digit, select_tiles
+
+
+def tile(value, height=2, width=2):
+    return np.full((height, width, 3), value, dtype=np.uint8)
+
+
+def test_identical_tile_scores_zero():
+    template = np.arange(12, dtype=np.uint8).reshape(2, 2, 3)
+    scores = match_digit(template, np.stack([template]))
+    assert scores.tolist() == [0]
+
+
+def test_uint8_differences_do_not_wrap():
+    # 0 vs 255 must score 255**2 per channel in both directions, not a wrapped (1)**2
+    scores = match_digit(tile(0), np.stack([tile(255)]))
+    assert scores.tolist() == [65025 * 12]
+    scores = match_digit(tile(255), np.stack([tile(0)]))
+    assert scores.tolist() == [65025 * 12]
+
+
+def test_select_tiles_includes_tiles_at_the_threshold():
+    template = tile(0)
+    tiles = np.stack([tile(0), tile(255), tile(10), tile(11)])
+    # Mean squared differences per element: 0, 65025, 100, 121
+    assert select_tiles(template, tiles, 100) == [0, 2]
+    assert select_tiles(template, tiles, 99) == [0]
+    assert select_tiles(template, tiles, 65025) == [0, 1, 2, 3]
@@ -0,0 +1,91 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip("aiohttp")
+pytest.importorskip("websockets")
+
+from backend_test import BLSBackendTester, Step
+
+CATEGORY = "applicant_management"
+
+
+def make_tester(responses):
+    """Tester whose endpoint calls are answered from responses and recorded as events"""
+    tester = BLSBackendTester()
+    tester.events = []
+    tester.calls = []
+
+    async def fake_endpoint(method, endpoint, data=None, expected_status=200):
+        tester.calls.append((method, endpoint))
+        tester.events.append(("start", endpoint))
+        await asyncio.sleep(0)
+        tester.events.append(("end", endpoint))
+        return responses.get(endpoint, (200, {}))
+
+    tester.test_api_endpoint = fake_endpoint
+    return tester
+
+
+def logged(tester):
+    return tester.test_results[CATEGORY]["tests"]
+
+
+def test_depends_on_orders_phases_and_gathers_independent_steps():
+    tester = make_tester({})
+    asyncio.run(tester.run_steps(CATEGORY, [
+        Step("c", "GET", "/c", depends_on=("a", "b"), ok="ok", failure="fail"),
+        Step("a", "GET", "/a", ok="ok", failure="fail"),
+        Step("b", "GET", "/b", ok="ok", failure="fail"),
+    ]))
+
+    # a and b are in flight together; c only starts once both have finished
+    assert tester.events[:2] == [("start", "/a"), ("start", "/b")]
+    assert tester.events.index(("start", "/c")) > tester.events.index(("end", "/a"))
+    assert tester.events.index(("start", "/c")) > tester.events.index(("end", "/b"))
+    assert all(result["success"] for result in logged(tester).values())
+
+
+def test_step_with_missing_id_is_skipped_and_its_dependents_still_run():
+    tester = make_tester({"/items": (500, {"detail": "boom"})})
+    asyncio.run(tester.run_steps(CATEGORY, [
+        Step("create", "POST", "/items", body={}, saves="item_id",
+             check=lambda r, ctx: "id" in r, ok="ok", failure="fail"),
+        Step("get", "GET", "/items/{item_id}", depends_on=("create",), requires=("item_id",),
+             ok="ok", failure="fail"),
+        Step("after", "GET", "/after", depends_on=("get",), ok="ok", failure="fail"),
+    ]))
+
+    results = logged(tester)
+    assert results["create"]["success"] is False
+    assert "get" not in results
+    assert results["after"]["success"] is True
+    assert [endpoint for _, endpoint in tester.calls] == ["/items", "/after"]
+    assert tester.test_results["summary"]["failed"] == 1
+
+
+def test_saved_id_fills_later_path_templates():
+    tester = make_tester({"/items": (200, {"id": "abc"})})
+    asyncio.run(tester.run_steps(CATEGORY, [
+        Step("create", "POST", "/items", body={}, saves="item_id",
+             check=lambda r, ctx: "id" in r, ok="ok", failure="fail"),
+        Step("get", "GET", "/items/{item_id}", depends_on=("create",), requires=("item_id",),
+             ok="ok", failure="fail"),
+        Step("test", "POST", "/items/{item_id}/test", depends_on=("create",), requires=("item_id",),
+             ok="ok", failure="fail"),
+    ]))
+
+    assert tester.calls == [
+        ("POST", "/items"),
+        ("GET", "/items/abc"),
+        ("POST", "/items/abc/test"),
+    ]
+
+
+def test_unresolvable_dependencies_raise():
+    tester = make_tester({})
+    with pytest.raises(ValueError, match="Unresolvable step dependencies"):
+        asyncio.run(tester.run_steps(CATEGORY, [
+            Step("x", "GET", "/x", depends_on=("y",), ok="ok", failure="fail"),
+            Step("y", "GET", "/y", depends_on=("x",), ok="ok", failure="fail"),
+        ]))